@@ -0,0 +1,278 @@
+"""ctypes fallback bindings for the ``cabi_rust_libp2p`` shared library.
+
+The example scripts prefer the Cython-compiled ``cabi_libp2p`` extension
+(built via ``setup.py``) and import this module only when the extension is
+absent. Both modules expose the same surface: ``Node``, ``init_tracing`` and
+the ABI status constants.
+"""
+
+import ctypes
+import functools
+import os
+import sys
+import threading
+import weakref
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+try:
+    repo_root = Path(__file__).resolve().parents[3]
+    DEFAULT_LIB = (
+        repo_root / "c-abi-libp2p" / "target" / "debug" / "libcabi_rust_libp2p.so"
+    )
+except IndexError:
+    DEFAULT_LIB = Path("/nonexistent/lib.so")
+
+LIB_PATH = Path(os.environ.get("FIDONEXT_C_ABI", DEFAULT_LIB))
+
+# Status codes exported from the ABI.
+CABI_STATUS_SUCCESS = 0
+CABI_STATUS_NULL_POINTER = 1
+CABI_STATUS_INVALID_ARGUMENT = 2
+CABI_STATUS_INTERNAL_ERROR = 3
+CABI_STATUS_QUEUE_EMPTY = 4
+CABI_STATUS_BUFFER_TOO_SMALL = 5
+
+# AutoNAT statuses
+CABI_AUTONAT_UNKNOWN = 0
+CABI_AUTONAT_PRIVATE = 1
+CABI_AUTONAT_PUBLIC = 2
+
+@functools.lru_cache(maxsize=1)
+def _get_lib() -> ctypes.CDLL:
+    """Load and configure the shared library once per process.
+
+    RTLD_LOCAL keeps repeated loads (e.g. several test processes importing
+    through different paths) from polluting the global symbol table.
+    """
+    if not LIB_PATH.exists():
+        print(f"Shared library not found at {LIB_PATH}.", file=sys.stderr)
+        print("Run `cargo build` in c-abi-libp2p first or set FIDONEXT_C_ABI.", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        lib = ctypes.CDLL(str(LIB_PATH), mode=ctypes.RTLD_LOCAL)
+    except OSError as exc:
+        print(f"Failed to load library {LIB_PATH}: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    lib.cabi_init_tracing.restype = ctypes.c_int
+    lib.cabi_node_new.argtypes = [
+        ctypes.c_bool,
+        ctypes.c_bool,
+        ctypes.POINTER(ctypes.c_char_p),
+        ctypes.c_size_t,
+        ctypes.POINTER(ctypes.c_ubyte),
+        ctypes.c_size_t,
+    ]
+    lib.cabi_node_new.restype = ctypes.c_void_p
+    lib.cabi_node_listen.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    lib.cabi_node_listen.restype = ctypes.c_int
+    lib.cabi_node_dial.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    lib.cabi_node_dial.restype = ctypes.c_int
+    lib.cabi_autonat_status.argtypes = [ctypes.c_void_p]
+    lib.cabi_autonat_status.restype = ctypes.c_int
+    lib.cabi_node_enqueue_message.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_ubyte),
+        ctypes.c_size_t,
+    ]
+    lib.cabi_node_enqueue_message.restype = ctypes.c_int
+    lib.cabi_node_dequeue_message.argtypes = [
+        ctypes.c_void_p,
+        ctypes.POINTER(ctypes.c_ubyte),
+        ctypes.c_size_t,
+        ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.cabi_node_dequeue_message.restype = ctypes.c_int
+    lib.cabi_node_local_peer_id.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+        ctypes.POINTER(ctypes.c_size_t),
+    ]
+    lib.cabi_node_local_peer_id.restype = ctypes.c_int
+    lib.cabi_node_free.argtypes = [ctypes.c_void_p]
+    lib.cabi_node_free.restype = None
+    return lib
+
+
+lib = _get_lib()
+
+# Bind the configured function objects once: `lib.<name>` goes through
+# __getattr__ and a dict lookup on every access, which adds up on hot calls
+# like dial/listen retries and the receive poll loop.
+_init_tracing = lib.cabi_init_tracing
+_node_new = lib.cabi_node_new
+_node_listen = lib.cabi_node_listen
+_node_dial = lib.cabi_node_dial
+_autonat_status = lib.cabi_autonat_status
+_enqueue_message = lib.cabi_node_enqueue_message
+_dequeue_message = lib.cabi_node_dequeue_message
+_local_peer_id = lib.cabi_node_local_peer_id
+_node_free = lib.cabi_node_free
+
+
+def _check(status: int, context: str) -> None:
+    if status == CABI_STATUS_SUCCESS:
+        return
+    if status == CABI_STATUS_NULL_POINTER:
+        reason = "null pointer passed into ABI"
+    elif status == CABI_STATUS_INVALID_ARGUMENT:
+        reason = "invalid argument (multiaddr or UTF-8)"
+    elif status == CABI_STATUS_BUFFER_TOO_SMALL:
+        reason = "provided buffer too small"
+    else:
+        reason = "internal error – inspect Rust logs for details"
+    raise RuntimeError(f"{context} failed: {reason} (status={status})")
+
+
+_tracing_lock = threading.Lock()
+_tracing_inited = False
+
+
+def init_tracing() -> None:
+    """Initialise Rust-side tracing; idempotent across threads and callers."""
+    global _tracing_inited
+    with _tracing_lock:
+        if _tracing_inited:
+            return
+        _check(_init_tracing(), "init tracing")
+        _tracing_inited = True
+
+
+class Node:
+    def __init__(
+        self,
+        *,
+        use_quic: bool = False,
+        enable_relay_hop: bool = False,
+        bootstrap_peers: Optional[Sequence[str]] = None,
+        identity_seed: Optional[bytes] = None,
+    ) -> None:
+        bootstrap_peers = list(bootstrap_peers or [])
+        if bootstrap_peers:
+            encoded = [addr.encode("utf-8") for addr in bootstrap_peers]
+            self._bootstrap_array = (ctypes.c_char_p * len(encoded))(*encoded)
+            bootstrap_ptr = ctypes.cast(
+                self._bootstrap_array, ctypes.POINTER(ctypes.c_char_p)
+            )
+        else:
+            self._bootstrap_array = None
+            bootstrap_ptr = None
+
+        if identity_seed is not None:
+            if len(identity_seed) != 32:
+                raise ValueError("identity_seed must contain exactly 32 bytes")
+            self._seed_buffer = (ctypes.c_ubyte * len(identity_seed))(*identity_seed)
+            seed_ptr = ctypes.cast(self._seed_buffer, ctypes.POINTER(ctypes.c_ubyte))
+            seed_len = len(identity_seed)
+        else:
+            self._seed_buffer = None
+            seed_ptr = None
+            seed_len = 0
+
+        pointer = _node_new(
+            ctypes.c_bool(use_quic),
+            ctypes.c_bool(enable_relay_hop),
+            bootstrap_ptr,
+            ctypes.c_size_t(len(bootstrap_peers)),
+            seed_ptr,
+            ctypes.c_size_t(seed_len),
+        )
+        if not pointer:
+            raise RuntimeError("cabi_node_new returned NULL, check Rust logs")
+        # Keep the raw address as an int (argtypes coerce it to c_void_p) and
+        # free it through weakref.finalize rather than __del__: the finalizer
+        # closure references only the bound function and the address, so a
+        # reference cycle through e.g. a signal-handler closure cannot strand
+        # the Rust node (and its sockets) in gc.garbage.
+        self._ptr = pointer
+        self._finalizer = weakref.finalize(self, _node_free, pointer)
+        # Encoded multiaddrs, keyed by the original string. Dial retries pass
+        # the same address repeatedly; caching skips the re-encode and keeps
+        # the bytes object owned by the node for the duration of the call.
+        self._addr_cache: dict = {}
+
+    def _encoded_addr(self, multiaddr: str) -> bytes:
+        encoded = self._addr_cache.get(multiaddr)
+        if encoded is None:
+            encoded = multiaddr.encode("utf-8")
+            self._addr_cache[multiaddr] = encoded
+        return encoded
+
+    def listen(self, multiaddr: str) -> None:
+        print(f"Attempting to listen on {multiaddr}...")
+        _check(
+            _node_listen(self._ptr, self._encoded_addr(multiaddr)),
+            f"listen({multiaddr})",
+        )
+        print(f"Listening on {multiaddr}")
+
+    def dial(self, multiaddr: str) -> None:
+        print(f"Attempting to dial {multiaddr}...")
+        _check(
+            _node_dial(self._ptr, self._encoded_addr(multiaddr)),
+            f"dial({multiaddr})",
+        )
+        print(f"Dialed {multiaddr}")
+
+    def local_peer_id(self) -> str:
+        buffer_len = 128
+        while True:
+            buffer = (ctypes.c_char * buffer_len)()
+            written = ctypes.c_size_t(0)
+            status = _local_peer_id(
+                self._ptr,
+                ctypes.cast(buffer, ctypes.c_void_p),
+                ctypes.c_size_t(buffer_len),
+                ctypes.byref(written),
+            )
+            if status == CABI_STATUS_BUFFER_TOO_SMALL:
+                buffer_len = max(buffer_len * 2, written.value + 1)
+                continue
+            _check(status, "local_peer_id")
+            return bytes(buffer[: written.value]).decode("utf-8")
+
+    def autonat_status(self) -> int:
+        status = _autonat_status(self._ptr)
+        if status > CABI_AUTONAT_PUBLIC:
+            _check(status, "autonat_status")
+        return status
+
+    def send_message(self, payload: Union[bytes, bytearray, str]) -> None:
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        buffer = (ctypes.c_ubyte * len(payload)).from_buffer_copy(payload)
+        _check(
+            _enqueue_message(
+                self._ptr, buffer, ctypes.c_size_t(len(payload))
+            ),
+            "enqueue_message",
+        )
+
+    def try_receive_message(self, buffer_size: int = 1024) -> Optional[bytes]:
+        current_size = buffer_size
+        while True:
+            out_buffer = (ctypes.c_ubyte * current_size)()
+            written = ctypes.c_size_t(0)
+            status = _dequeue_message(
+                self._ptr,
+                out_buffer,
+                ctypes.c_size_t(current_size),
+                ctypes.byref(written),
+            )
+            if status == CABI_STATUS_QUEUE_EMPTY:
+                return None
+            if status == CABI_STATUS_BUFFER_TOO_SMALL:
+                needed = max(written.value, current_size * 2)
+                current_size = max(needed, 1)
+                continue
+            _check(status, "dequeue_message")
+            return bytes(out_buffer[: written.value])
+
+    def close(self) -> None:
+        if getattr(self, "_finalizer", None) is not None and self._finalizer.alive:
+            print("Closing node...")
+            self._finalizer()
+            self._ptr = None
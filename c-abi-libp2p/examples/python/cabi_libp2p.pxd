@@ -0,0 +1,43 @@
+# cython: language_level=3
+"""Compile-time declarations for the cabi_rust_libp2p C ABI.
+
+Matches ``cabi-rust-libp2p.h`` as generated by ``build.rs`` (cbindgen).
+"""
+
+from libc.stdint cimport uint8_t
+
+
+cdef extern from "cabi-rust-libp2p.h":
+    ctypedef struct CabiNodeHandle:
+        pass
+
+    int cabi_init_tracing() nogil
+    CabiNodeHandle *cabi_node_new(
+        bint use_quic,
+        bint enable_relay_hop,
+        const char *const *bootstrap_peers,
+        size_t bootstrap_peers_len,
+        const uint8_t *identity_seed,
+        size_t identity_seed_len,
+    ) nogil
+    int cabi_node_listen(CabiNodeHandle *handle, const char *address) nogil
+    int cabi_node_dial(CabiNodeHandle *handle, const char *address) nogil
+    int cabi_autonat_status(CabiNodeHandle *handle) nogil
+    int cabi_node_enqueue_message(
+        CabiNodeHandle *handle,
+        const uint8_t *data_ptr,
+        size_t data_len,
+    ) nogil
+    int cabi_node_dequeue_message(
+        CabiNodeHandle *handle,
+        uint8_t *out_buffer,
+        size_t buffer_len,
+        size_t *written_len,
+    ) nogil
+    int cabi_node_local_peer_id(
+        CabiNodeHandle *handle,
+        char *out_buffer,
+        size_t buffer_len,
+        size_t *written_len,
+    ) nogil
+    void cabi_node_free(CabiNodeHandle *handle) nogil
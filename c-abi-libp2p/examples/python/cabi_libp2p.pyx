@@ -0,0 +1,218 @@
+# cython: language_level=3
+"""Cython-compiled bindings for the ``cabi_rust_libp2p`` shared library.
+
+Exposes the same surface as the ctypes fallback in ``cabi_ctypes.py``
+(``Node``, ``init_tracing`` and the ABI status constants) but binds the ABI
+at compile time, so ``listen``/``dial`` are near-direct C calls instead of
+per-call ctypes marshalling. Blocking calls release the GIL.
+
+Build with ``python setup.py build_ext --inplace`` after ``cargo build``; the
+example scripts fall back to ctypes when this extension is absent.
+"""
+
+import threading
+
+from libc.stdlib cimport free, malloc
+
+# Status codes exported from the ABI.
+CABI_STATUS_SUCCESS = 0
+CABI_STATUS_NULL_POINTER = 1
+CABI_STATUS_INVALID_ARGUMENT = 2
+CABI_STATUS_INTERNAL_ERROR = 3
+CABI_STATUS_QUEUE_EMPTY = 4
+CABI_STATUS_BUFFER_TOO_SMALL = 5
+
+# AutoNAT statuses
+CABI_AUTONAT_UNKNOWN = 0
+CABI_AUTONAT_PRIVATE = 1
+CABI_AUTONAT_PUBLIC = 2
+
+
+def _check(int status, str context):
+    if status == CABI_STATUS_SUCCESS:
+        return
+    if status == CABI_STATUS_NULL_POINTER:
+        reason = "null pointer passed into ABI"
+    elif status == CABI_STATUS_INVALID_ARGUMENT:
+        reason = "invalid argument (multiaddr or UTF-8)"
+    elif status == CABI_STATUS_BUFFER_TOO_SMALL:
+        reason = "provided buffer too small"
+    else:
+        reason = "internal error – inspect Rust logs for details"
+    raise RuntimeError(f"{context} failed: {reason} (status={status})")
+
+
+_tracing_lock = threading.Lock()
+_tracing_inited = False
+
+
+def init_tracing():
+    """Initialise Rust-side tracing; idempotent across threads and callers."""
+    global _tracing_inited
+    cdef int status
+    with _tracing_lock:
+        if _tracing_inited:
+            return
+        with nogil:
+            status = cabi_init_tracing()
+        _check(status, "init tracing")
+        _tracing_inited = True
+
+
+cdef class Node:
+    cdef CabiNodeHandle *_ptr
+    # Encoded multiaddrs keyed by the original string; dial retries reuse the
+    # same address, so cache the UTF-8 bytes instead of re-encoding per call.
+    cdef dict _addr_cache
+
+    def __cinit__(
+        self,
+        *,
+        bint use_quic=False,
+        bint enable_relay_hop=False,
+        bootstrap_peers=None,
+        identity_seed=None,
+    ):
+        cdef list encoded = [
+            addr.encode("utf-8") for addr in (bootstrap_peers or [])
+        ]
+        cdef size_t peers_len = len(encoded)
+        cdef const char **peers_array = NULL
+        cdef const uint8_t *seed_ptr = NULL
+        cdef size_t seed_len = 0
+        cdef bytes seed_bytes
+        cdef size_t i
+
+        self._ptr = NULL
+        self._addr_cache = {}
+        if identity_seed is not None:
+            if len(identity_seed) != 32:
+                raise ValueError("identity_seed must contain exactly 32 bytes")
+            seed_bytes = bytes(identity_seed)
+            seed_ptr = <const uint8_t *><const char *>seed_bytes
+            seed_len = len(seed_bytes)
+
+        try:
+            if peers_len:
+                peers_array = <const char **>malloc(peers_len * sizeof(char *))
+                if peers_array == NULL:
+                    raise MemoryError()
+                for i in range(peers_len):
+                    peers_array[i] = <const char *>(<bytes>encoded[i])
+            self._ptr = cabi_node_new(
+                use_quic,
+                enable_relay_hop,
+                peers_array,
+                peers_len,
+                seed_ptr,
+                seed_len,
+            )
+        finally:
+            if peers_array != NULL:
+                free(peers_array)
+
+        if self._ptr == NULL:
+            raise RuntimeError("cabi_node_new returned NULL, check Rust logs")
+
+    cdef bytes _encoded_addr(self, str multiaddr):
+        cdef bytes encoded = self._addr_cache.get(multiaddr)
+        if encoded is None:
+            encoded = multiaddr.encode("utf-8")
+            self._addr_cache[multiaddr] = encoded
+        return encoded
+
+    cpdef listen(self, str multiaddr):
+        print(f"Attempting to listen on {multiaddr}...")
+        cdef bytes encoded = self._encoded_addr(multiaddr)
+        cdef const char *address = encoded
+        cdef int status
+        with nogil:
+            status = cabi_node_listen(self._ptr, address)
+        _check(status, f"listen({multiaddr})")
+        print(f"Listening on {multiaddr}")
+
+    cpdef dial(self, str multiaddr):
+        print(f"Attempting to dial {multiaddr}...")
+        cdef bytes encoded = self._encoded_addr(multiaddr)
+        cdef const char *address = encoded
+        cdef int status
+        with nogil:
+            status = cabi_node_dial(self._ptr, address)
+        _check(status, f"dial({multiaddr})")
+        print(f"Dialed {multiaddr}")
+
+    def local_peer_id(self):
+        cdef size_t buffer_len = 128
+        cdef size_t written = 0
+        cdef char *buffer
+        cdef int status
+        while True:
+            buffer = <char *>malloc(buffer_len)
+            if buffer == NULL:
+                raise MemoryError()
+            try:
+                status = cabi_node_local_peer_id(
+                    self._ptr, buffer, buffer_len, &written
+                )
+                if status == CABI_STATUS_BUFFER_TOO_SMALL:
+                    buffer_len = max(buffer_len * 2, written + 1)
+                    continue
+                _check(status, "local_peer_id")
+                return buffer[:written].decode("utf-8")
+            finally:
+                free(buffer)
+
+    def autonat_status(self):
+        cdef int status = cabi_autonat_status(self._ptr)
+        if status > CABI_AUTONAT_PUBLIC:
+            _check(status, "autonat_status")
+        return status
+
+    def send_message(self, payload):
+        cdef bytes data
+        cdef const uint8_t *data_ptr
+        cdef size_t data_len
+        cdef int status
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        data = bytes(payload)
+        data_ptr = <const uint8_t *><const char *>data
+        data_len = len(data)
+        with nogil:
+            status = cabi_node_enqueue_message(self._ptr, data_ptr, data_len)
+        _check(status, "enqueue_message")
+
+    def try_receive_message(self, size_t buffer_size=1024):
+        cdef size_t current_size = buffer_size
+        cdef size_t written = 0
+        cdef uint8_t *out_buffer
+        cdef int status
+        while True:
+            out_buffer = <uint8_t *>malloc(current_size)
+            if out_buffer == NULL:
+                raise MemoryError()
+            try:
+                with nogil:
+                    status = cabi_node_dequeue_message(
+                        self._ptr, out_buffer, current_size, &written
+                    )
+                if status == CABI_STATUS_QUEUE_EMPTY:
+                    return None
+                if status == CABI_STATUS_BUFFER_TOO_SMALL:
+                    current_size = max(written, current_size * 2)
+                    continue
+                _check(status, "dequeue_message")
+                return (<char *>out_buffer)[:written]
+            finally:
+                free(out_buffer)
+
+    def close(self):
+        if self._ptr != NULL:
+            print("Closing node...")
+            cabi_node_free(self._ptr)
+            self._ptr = NULL
+
+    def __dealloc__(self):
+        if self._ptr != NULL:
+            cabi_node_free(self._ptr)
+            self._ptr = NULL
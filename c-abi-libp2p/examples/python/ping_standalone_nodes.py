@@ -8,104 +8,35 @@ forwards stdin payloads over the gossipsub bridge.
 """
 
 import argparse
-import ctypes
 import os
+import random
 import signal
 import sys
 import threading
 import time
-from pathlib import Path
-from typing import Optional, Sequence, Union
-
-# Setup similar to ping_two_nodes.py
-try:
-    repo_root = Path(__file__).resolve().parents[3]
-    DEFAULT_LIB = (
-        repo_root / "c-abi-libp2p" / "target" / "debug" / "libcabi_rust_libp2p.so"
-    )
-except IndexError:
-    DEFAULT_LIB = Path("/nonexistent/lib.so")
-
-LIB_PATH = Path(os.environ.get("FIDONEXT_C_ABI", DEFAULT_LIB))
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
 
 os.environ.setdefault("RUST_LOG", "info,peer=info,ffi=info")
 
-if not LIB_PATH.exists():
-    print(f"Shared library not found at {LIB_PATH}.", file=sys.stderr)
-    print("Run `cargo build` in c-abi-libp2p first or set FIDONEXT_C_ABI.", file=sys.stderr)
-    sys.exit(1)
-
+# Prefer the Cython-compiled bindings (see setup.py) and fall back to ctypes
+# when the extension has not been built.
 try:
-    lib = ctypes.CDLL(str(LIB_PATH))
-except OSError as exc:
-    print(f"Failed to load library {LIB_PATH}: {exc}", file=sys.stderr)
-    sys.exit(1)
-
-# Status codes exported from the ABI.
-CABI_STATUS_SUCCESS = 0
-CABI_STATUS_NULL_POINTER = 1
-CABI_STATUS_INVALID_ARGUMENT = 2
-CABI_STATUS_INTERNAL_ERROR = 3
-CABI_STATUS_QUEUE_EMPTY = 4
-CABI_STATUS_BUFFER_TOO_SMALL = 5
-
-# AutoNAT statuses
-CABI_AUTONAT_UNKNOWN = 0
-CABI_AUTONAT_PRIVATE = 1
-CABI_AUTONAT_PUBLIC = 2
-
-lib.cabi_init_tracing.restype = ctypes.c_int
-lib.cabi_node_new.argtypes = [
-    ctypes.c_bool,
-    ctypes.c_bool,
-    ctypes.POINTER(ctypes.c_char_p),
-    ctypes.c_size_t,
-    ctypes.POINTER(ctypes.c_ubyte),
-    ctypes.c_size_t,
-]
-lib.cabi_node_new.restype = ctypes.c_void_p
-lib.cabi_node_listen.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-lib.cabi_node_listen.restype = ctypes.c_int
-lib.cabi_node_dial.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-lib.cabi_node_dial.restype = ctypes.c_int
-lib.cabi_autonat_status.argtypes = [ctypes.c_void_p]
-lib.cabi_autonat_status.restype = ctypes.c_int
-lib.cabi_node_enqueue_message.argtypes = [
-    ctypes.c_void_p,
-    ctypes.POINTER(ctypes.c_ubyte),
-    ctypes.c_size_t,
-]
-lib.cabi_node_enqueue_message.restype = ctypes.c_int
-lib.cabi_node_dequeue_message.argtypes = [
-    ctypes.c_void_p,
-    ctypes.POINTER(ctypes.c_ubyte),
-    ctypes.c_size_t,
-    ctypes.POINTER(ctypes.c_size_t),
-]
-lib.cabi_node_dequeue_message.restype = ctypes.c_int
-lib.cabi_node_local_peer_id.argtypes = [
-    ctypes.c_void_p,
-    ctypes.c_void_p,
-    ctypes.c_size_t,
-    ctypes.POINTER(ctypes.c_size_t),
-]
-lib.cabi_node_local_peer_id.restype = ctypes.c_int
-lib.cabi_node_free.argtypes = [ctypes.c_void_p]
-lib.cabi_node_free.restype = None
-
-
-def _check(status: int, context: str) -> None:
-    if status == CABI_STATUS_SUCCESS:
-        return
-    if status == CABI_STATUS_NULL_POINTER:
-        reason = "null pointer passed into ABI"
-    elif status == CABI_STATUS_INVALID_ARGUMENT:
-        reason = "invalid argument (multiaddr or UTF-8)"
-    elif status == CABI_STATUS_BUFFER_TOO_SMALL:
-        reason = "provided buffer too small"
-    else:
-        reason = "internal error – inspect Rust logs for details"
-    raise RuntimeError(f"{context} failed: {reason} (status={status})")
+    from cabi_libp2p import (
+        CABI_AUTONAT_PRIVATE,
+        CABI_AUTONAT_PUBLIC,
+        CABI_AUTONAT_UNKNOWN,
+        Node,
+        init_tracing,
+    )
+except ImportError:
+    from cabi_ctypes import (
+        CABI_AUTONAT_PRIVATE,
+        CABI_AUTONAT_PUBLIC,
+        CABI_AUTONAT_UNKNOWN,
+        Node,
+        init_tracing,
+    )
 
 
 def default_listen(use_quic: bool) -> str:
@@ -146,129 +77,6 @@ def derive_seed_from_phrase(seed_phrase: str) -> bytes:
     return bytes(seed)
 
 
-class Node:
-    def __init__(
-        self,
-        *,
-        use_quic: bool = False,
-        enable_relay_hop: bool = False,
-        bootstrap_peers: Optional[Sequence[str]] = None,
-        identity_seed: Optional[bytes] = None,
-    ) -> None:
-        bootstrap_peers = list(bootstrap_peers or [])
-        if bootstrap_peers:
-            encoded = [addr.encode("utf-8") for addr in bootstrap_peers]
-            self._bootstrap_array = (ctypes.c_char_p * len(encoded))(*encoded)
-            bootstrap_ptr = ctypes.cast(
-                self._bootstrap_array, ctypes.POINTER(ctypes.c_char_p)
-            )
-        else:
-            self._bootstrap_array = None
-            bootstrap_ptr = None
-
-        if identity_seed is not None:
-            if len(identity_seed) != 32:
-                raise ValueError("identity_seed must contain exactly 32 bytes")
-            self._seed_buffer = (ctypes.c_ubyte * len(identity_seed))(*identity_seed)
-            seed_ptr = ctypes.cast(self._seed_buffer, ctypes.POINTER(ctypes.c_ubyte))
-            seed_len = len(identity_seed)
-        else:
-            self._seed_buffer = None
-            seed_ptr = None
-            seed_len = 0
-
-        pointer = lib.cabi_node_new(
-            ctypes.c_bool(use_quic),
-            ctypes.c_bool(enable_relay_hop),
-            bootstrap_ptr,
-            ctypes.c_size_t(len(bootstrap_peers)),
-            seed_ptr,
-            ctypes.c_size_t(seed_len),
-        )
-        if not pointer:
-            raise RuntimeError("cabi_node_new returned NULL, check Rust logs")
-        self._ptr = ctypes.c_void_p(pointer)
-
-    def listen(self, multiaddr: str) -> None:
-        print(f"Attempting to listen on {multiaddr}...")
-        _check(
-            lib.cabi_node_listen(self._ptr, multiaddr.encode("utf-8")),
-            f"listen({multiaddr})",
-        )
-        print(f"Listening on {multiaddr}")
-
-    def dial(self, multiaddr: str) -> None:
-        print(f"Attempting to dial {multiaddr}...")
-        _check(
-            lib.cabi_node_dial(self._ptr, multiaddr.encode("utf-8")),
-            f"dial({multiaddr})",
-        )
-        print(f"Dialed {multiaddr}")
-
-    def local_peer_id(self) -> str:
-        buffer_len = 128
-        while True:
-            buffer = (ctypes.c_char * buffer_len)()
-            written = ctypes.c_size_t(0)
-            status = lib.cabi_node_local_peer_id(
-                self._ptr,
-                ctypes.cast(buffer, ctypes.c_void_p),
-                ctypes.c_size_t(buffer_len),
-                ctypes.byref(written),
-            )
-            if status == CABI_STATUS_BUFFER_TOO_SMALL:
-                buffer_len = max(buffer_len * 2, written.value + 1)
-                continue
-            _check(status, "local_peer_id")
-            return bytes(buffer[: written.value]).decode("utf-8")
-
-    def autonat_status(self) -> int:
-        status = lib.cabi_autonat_status(self._ptr)
-        if status > CABI_AUTONAT_PUBLIC:
-            _check(status, "autonat_status")
-        return status
-
-    def send_message(self, payload: Union[bytes, bytearray, str]) -> None:
-        if isinstance(payload, str):
-            payload = payload.encode("utf-8")
-        buffer = (ctypes.c_ubyte * len(payload)).from_buffer_copy(payload)
-        _check(
-            lib.cabi_node_enqueue_message(
-                self._ptr, buffer, ctypes.c_size_t(len(payload))
-            ),
-            "enqueue_message",
-        )
-
-    def try_receive_message(self, buffer_size: int = 1024) -> Optional[bytes]:
-        current_size = buffer_size
-        while True:
-            out_buffer = (ctypes.c_ubyte * current_size)()
-            written = ctypes.c_size_t(0)
-            status = lib.cabi_node_dequeue_message(
-                self._ptr,
-                out_buffer,
-                ctypes.c_size_t(current_size),
-                ctypes.byref(written),
-            )
-            if status == CABI_STATUS_QUEUE_EMPTY:
-                return None
-            if status == CABI_STATUS_BUFFER_TOO_SMALL:
-                needed = max(written.value, current_size * 2)
-                current_size = max(needed, 1)
-                continue
-            _check(status, "dequeue_message")
-            return bytes(out_buffer[: written.value])
-
-    def close(self) -> None:
-        if getattr(self, "_ptr", None):
-            print("Closing node...")
-            lib.cabi_node_free(self._ptr)
-            self._ptr = None
-
-    def __del__(self) -> None:
-        self.close()
-
-
 def wait_for_public_autonat(
     node: Node, timeout: float = 10.0, poll_interval: float = 1.0
 ) -> bool:
@@ -286,50 +94,110 @@ def wait_for_public_autonat(
     return False
 
 
-def dial_peers(node: Node, peers: Sequence[str], label: str) -> None:
-    for addr in peers:
+def dial_with_retry(
+    node: Node,
+    addr: str,
+    stop_event: threading.Event,
+    max_retries: int = 10,
+    backoff_cap: float = 2.0,
+) -> None:
+    """Dial with capped exponential backoff and full jitter between attempts.
+
+    The jitter keeps several dialers that start together from retrying in
+    lockstep against the same listener; the stop event cuts the backoff wait
+    short on shutdown.
+    """
+    delay = 0.05
+    for attempt in range(max_retries):
         try:
             node.dial(addr)
+            return
+        except RuntimeError:
+            if attempt == max_retries - 1 or stop_event.is_set():
+                raise
+        stop_event.wait(delay * (0.5 + random.random()))
+        delay = min(delay * 2, backoff_cap)
+
+
+def dial_peers(
+    node: Node,
+    peers: Sequence[str],
+    label: str,
+    stop_event: threading.Event,
+    max_retries: int = 10,
+    backoff_cap: float = 2.0,
+    concurrency: int = 1,
+) -> None:
+    """Dial peers, fanning out over a thread pool when concurrency > 1.
+
+    Both binding implementations release the GIL inside the FFI call, so
+    worker threads let the Rust runtime overlap the handshakes; each worker
+    runs its own jittered backoff.
+    """
+    if not peers:
+        return
+
+    def attempt(addr: str) -> bool:
+        try:
+            dial_with_retry(node, addr, stop_event, max_retries, backoff_cap)
             print(f"Dialed {label} peer: {addr}")
+            return True
         except RuntimeError as exc:
             print(f"Failed to dial {label} peer {addr}: {exc}", file=sys.stderr)
+            return False
 
+    if concurrency <= 1 or len(peers) == 1:
+        results = [attempt(addr) for addr in peers]
+    else:
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(peers))) as pool:
+            results = list(pool.map(attempt, peers))
+    if len(peers) > 1:
+        print(f"Dialed {results.count(True)}/{len(peers)} {label} peers.")
 
-def recv_loop(node: Node, running: threading.Event, poll_interval: float = 0.1) -> None:
-    while running.is_set():
+
+def split_addrs(values: Sequence[str]) -> List[str]:
+    """Flatten repeatable, comma-separated multiaddr arguments."""
+    addrs: List[str] = []
+    for value in values:
+        addrs.extend(addr.strip() for addr in value.split(",") if addr.strip())
+    return addrs
+
+
+def recv_loop(node: Node, stop_event: threading.Event, poll_interval: float = 0.1) -> None:
+    while not stop_event.is_set():
         try:
             payload = node.try_receive_message()
         except RuntimeError as exc:
             print(f"Receive loop error: {exc}", file=sys.stderr)
-            running.clear()
+            stop_event.set()
             break
         if payload is None:
-            time.sleep(poll_interval)
+            stop_event.wait(poll_interval)
             continue
         text = payload.decode("utf-8", "replace")
         print(f"Received payload: '{text}'", flush=True)
 
 
-def interactive_send_loop(node: Node, running: threading.Event) -> None:
+def interactive_send_loop(node: Node, stop_event: threading.Event) -> None:
     print("Enter payload (empty line or /quit to exit):")
-    while running.is_set():
+    while not stop_event.is_set():
         try:
             line = input()
         except EOFError:
             print("STDIN closed; stopping send loop.")
-            running.clear()
+            stop_event.set()
             break
         except KeyboardInterrupt:
-            running.clear()
+            stop_event.set()
             break
         if not line or line.strip() == "/quit":
-            running.clear()
+            stop_event.set()
             break
         try:
             node.send_message(line.rstrip("\n"))
         except RuntimeError as exc:
             print(f"Failed to send message: {exc}", file=sys.stderr)
-            running.clear()
+            stop_event.set()
             break
         print("Enter payload (empty line or /quit to exit):")
 
@@ -362,13 +230,19 @@ def parse_args() -> argparse.Namespace:
         "--bootstrap",
         action="append",
         default=[],
-        help="Bootstrap peer multiaddr (repeatable).",
+        help="Bootstrap peer multiaddr (repeatable or comma-separated).",
     )
     parser.add_argument(
         "--target",
         action="append",
         default=[],
-        help="Peers to dial immediately (repeatable).",
+        help="Peers to dial immediately (repeatable or comma-separated).",
+    )
+    parser.add_argument(
+        "--dial-concurrency",
+        type=int,
+        default=1,
+        help="Worker threads used to dial bootstrap/target peers in parallel.",
     )
     seed_group = parser.add_mutually_exclusive_group()
     seed_group.add_argument(
@@ -379,6 +253,18 @@ def parse_args() -> argparse.Namespace:
         "--seed-phrase",
         help="Seed phrase expanded deterministically to 32 bytes.",
     )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=10,
+        help="Dial attempts per peer before giving up.",
+    )
+    parser.add_argument(
+        "--backoff-cap",
+        type=float,
+        default=2.0,
+        help="Upper bound in seconds for the exponential dial backoff.",
+    )
     parser.add_argument(
         "--message",
         help="Publish a scripted payload once after startup.",
@@ -400,9 +286,11 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    _check(lib.cabi_init_tracing(), "init tracing")
+    init_tracing()
 
     listen_addr = args.listen or default_listen(args.use_quic)
+    bootstrap_peers = split_addrs(args.bootstrap)
+    target_peers = split_addrs(args.target)
     identity_seed: Optional[bytes] = None
     if args.seed:
         identity_seed = parse_seed(args.seed)
@@ -413,16 +301,17 @@ def main() -> None:
         return Node(
             use_quic=args.use_quic,
             enable_relay_hop=enable_hop,
-            bootstrap_peers=args.bootstrap,
+            bootstrap_peers=bootstrap_peers,
             identity_seed=identity_seed,
         )
 
-    running = threading.Event()
-    running.set()
+    # Event-driven shutdown: signal handlers set the event and every wait
+    # below returns immediately instead of polling a flag once per second.
+    stop_event = threading.Event()
 
     def handle_signal(sig, frame):
         print("\nReceived signal, shutting down...", flush=True)
-        running.clear()
+        stop_event.set()
 
     signal.signal(signal.SIGINT, handle_signal)
     signal.signal(signal.SIGTERM, handle_signal)
@@ -454,11 +343,17 @@ def main() -> None:
                 else:
                     print("AutoNAT did not report PUBLIC; continuing without hop.")
 
-        dial_peers(node, args.bootstrap, "bootstrap")
-        dial_peers(node, args.target, "target")
+        dial_peers(
+            node, bootstrap_peers, "bootstrap", stop_event,
+            args.max_retries, args.backoff_cap, args.dial_concurrency,
+        )
+        dial_peers(
+            node, target_peers, "target", stop_event,
+            args.max_retries, args.backoff_cap, args.dial_concurrency,
+        )
 
         recv_thread = threading.Thread(
-            target=recv_loop, args=(node, running), daemon=True
+            target=recv_loop, args=(node, stop_event), daemon=True
         )
         recv_thread.start()
 
@@ -469,33 +364,25 @@ def main() -> None:
             delay = max(args.message_delay, 0.0)
             if delay:
                 print(f"Waiting {delay:.1f}s before scripted publish...", flush=True)
-                waited = 0.0
-                while running.is_set() and waited < delay:
-                    time.sleep(0.5)
-                    waited += 0.5
-            if running.is_set():
+                stop_event.wait(delay)
+            if not stop_event.is_set():
                 node.send_message(args.message)
                 print(f"Scripted payload published: {args.message!r}", flush=True)
-            wait_after = max(args.post_message_wait, 0.0)
-            waited = 0.0
-            while running.is_set() and waited < wait_after:
-                time.sleep(0.5)
-                waited += 0.5
-            running.clear()
+            stop_event.wait(max(args.post_message_wait, 0.0))
+            stop_event.set()
         elif sys.stdin.isatty() or force_stdin:
             if force_stdin and not sys.stdin.isatty():
                 print("STDIN override enabled; reading scripted input.", flush=True)
-            interactive_send_loop(node, running)
+            interactive_send_loop(node, stop_event)
         else:
             print("STDIN is non-interactive; running receive-only mode. Press Ctrl+C to exit.")
-            while running.is_set():
-                time.sleep(1)
+            stop_event.wait()
     except Exception as exc:
-        running.clear()
+        stop_event.set()
         print(f"Error: {exc}", file=sys.stderr)
         sys.exit(1)
     finally:
-        running.clear()
+        stop_event.set()
         if recv_thread:
             recv_thread.join(timeout=1.0)
         if node:
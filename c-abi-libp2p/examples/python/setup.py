@@ -0,0 +1,37 @@
+"""Builds the optional Cython extension wrapping the C ABI.
+
+Usage (after ``cargo build`` has produced ``libcabi_rust_libp2p.so``)::
+
+    pip install cython setuptools
+    python setup.py build_ext --inplace
+
+The example scripts pick up the resulting ``cabi_libp2p`` module
+automatically and fall back to ctypes when it is missing.
+"""
+
+from pathlib import Path
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+CRATE_DIR = Path(__file__).resolve().parents[2]
+TARGET_DIRS = [
+    str(CRATE_DIR / "target" / "release"),
+    str(CRATE_DIR / "target" / "debug"),
+]
+
+extensions = [
+    Extension(
+        "cabi_libp2p",
+        ["cabi_libp2p.pyx"],
+        include_dirs=[str(CRATE_DIR)],
+        libraries=["cabi_rust_libp2p"],
+        library_dirs=TARGET_DIRS,
+        runtime_library_dirs=TARGET_DIRS,
+    )
+]
+
+setup(
+    name="cabi-libp2p",
+    ext_modules=cythonize(extensions, language_level=3),
+)